@@ -10,15 +10,18 @@ and creates a well-formatted Markdown file suitable for publication.
 import subprocess
 import sys
 import argparse
-import re
 import os
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator
 
 
 class GitCommit:
     """Represents a single Git commit with parsed information."""
     
+    # One instance per commit; slots avoid a per-instance __dict__
+    __slots__ = ('hash', 'subject', 'author', 'date', 'type', 'scope', 'description')
+    
     def __init__(self, hash: str, subject: str, author: str, date: str):
         self.hash = hash
         self.subject = subject
@@ -26,7 +29,8 @@ class GitCommit:
         self.date = date
         self.type, self.scope, self.description = self.parse_commit_message(subject)
     
-    def parse_commit_message(self, message: str) -> Tuple[str, str, str]:
+    @staticmethod
+    def parse_commit_message(message: str) -> Tuple[str, str, str]:
         """
         Parse conventional commit message format: type(scope): description
         
@@ -36,14 +40,29 @@ class GitCommit:
         Returns:
             Tuple of (type, scope, description)
         """
-        # Regex pattern to match conventional commit format
-        pattern = r'^(\w+)(?:\(([^)]+)\))?:\s*(.*)'
-        match = re.match(pattern, message)
-        
-        if match:
-            commit_type = match.group(1).lower()
-            scope = match.group(2) if match.group(2) else ""
-            description = match.group(3)
+        # Hand-rolled equivalent of r'^(\w+)(?:\(([^)]+)\))?:\s*(.*)'
+        colon = message.find(':')
+        paren = message.find('(')
+        
+        if paren != -1 and (colon == -1 or paren < colon):
+            # type(scope): the scope may itself contain ':'
+            close = message.find(')', paren + 1)
+            if close > paren + 1 and message.startswith(':', close + 1):
+                head, scope, colon = message[:paren], message[paren + 1:close], close + 1
+            else:
+                head = ""
+        elif colon != -1:
+            head, scope = message[:colon], ""
+        else:
+            head = ""
+        
+        # The type must be a non-empty run of word characters
+        if head and head.replace('_', 'a').isalnum():
+            commit_type = head.lower()
+            description = message[colon + 1:].lstrip()
+            newline = description.find('\n')
+            if newline != -1:
+                description = description[:newline]
         else:
             # If not in conventional format, treat the whole message as description
             # and assign to 'other' type
@@ -78,8 +97,14 @@ class ReleaseNotesGenerator:
         'other': 'Other Changes'
     }
     
-    def __init__(self, repo_path: str = "."):
+    # Recognized commit types, for membership tests only
+    _VALID_TYPES = frozenset(COMMIT_TYPES)
+    
+    def __init__(self, repo_path: str = ".", include_all_commits: bool = False,
+                 repo_url: str = "https://github.com/unknown/unknown"):
         self.repo_path = repo_path
+        self.repo_url = repo_url.rstrip('/')
+        self.include_all_commits = include_all_commits
     
     def run_git_command(self, command: List[str], allow_failure: bool = False) -> Optional[str]:
         """
@@ -112,6 +137,55 @@ class ReleaseNotesGenerator:
                 print(f"Error message: {e.stderr}")
                 raise
     
+    def _iter_git_records(self, command: List[str], separator: bytes = b'\n') -> Iterator[str]:
+        """
+        Execute a git command and stream its output record by record.
+        
+        Unlike run_git_command, the output is never held in memory as a
+        single string, so large logs can be consumed while git is still
+        producing them. The pipe is read as bytes and each record is decoded
+        as UTF-8 on its own, skipping the text-mode wrapper and tolerating
+        commits with invalid encodings.
+        
+        Args:
+            command: List of command arguments
+            separator: Byte sequence between records (b'\x00' for git's -z)
+            
+        Yields:
+            Output records without the separator
+            
+        Raises:
+            subprocess.CalledProcessError: If git command fails
+        """
+        # Imported here: tempfile pulls in random and shutil, and only
+        # streamed commands need it
+        import tempfile
+        
+        # stderr goes to a file, not a second pipe: git could fill an unread
+        # pipe and block while we block reading stdout
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                ["git"] + command,
+                cwd=self.repo_path,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            ) as proc:
+                pending = b''
+                for chunk in iter(lambda: proc.stdout.read1(65536), b''):
+                    records = (pending + chunk).split(separator)
+                    pending = records.pop()
+                    for record in records:
+                        yield record.decode('utf-8', 'replace')
+                if pending:
+                    yield pending.decode('utf-8', 'replace')
+            
+            if proc.returncode:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', 'replace')
+                print(f"Error running git command: {' '.join(command)}")
+                print(f"Error message: {stderr}")
+                raise subprocess.CalledProcessError(proc.returncode, ["git"] + command, stderr=stderr)
+    
     def is_git_repo(self) -> bool:
         """Check if the current directory is a Git repository."""
         return self.run_git_command(["rev-parse", "--git-dir"], allow_failure=True) is not None
@@ -122,27 +196,28 @@ class ReleaseNotesGenerator:
         
         Returns:
             List of tag names sorted by date (newest first)
+            
+        Raises:
+            Exception: If the repository path is not a Git repository
         """
-        if not self.is_git_repo():
-            raise Exception(f"'{self.repo_path}' is not a Git repository")
-        
         # Get tags with their dates
         tags_with_date = []
         try:
-            # Get all tags with their dates
-            raw_tags = self.run_git_command(["for-each-ref", "--format='%(refname:short)|%(creatordate:iso)'", "refs/tags"])
+            # Get all tags with their creation dates as Unix timestamps
+            raw_tags = self.run_git_command(
+                ["for-each-ref", "--format=%(refname:short)|%(creatordate:unix)", "refs/tags"],
+                allow_failure=True
+            )
             
-            if raw_tags:
+            if raw_tags is not None:
                 for line in raw_tags.split('\n'):
                     if '|' in line:
-                        tag, date_str = line.strip("'").split('|', 1)
-                        # Convert date string to datetime object for sorting
+                        tag, _, timestamp = line.rpartition('|')
                         try:
-                            date_obj = datetime.strptime(date_str.split()[0], "%Y-%m-%d")
-                            tags_with_date.append((tag, date_obj))
+                            tags_with_date.append((tag, int(timestamp)))
                         except ValueError:
-                            # If date parsing fails, use the tag name as fallback
-                            tags_with_date.append((tag, datetime.min))
+                            # If the date is missing, sort the tag last
+                            tags_with_date.append((tag, 0))
                 
                 # Sort by date (descending - newest first)
                 tags_with_date.sort(key=lambda x: x[1], reverse=True)
@@ -150,6 +225,10 @@ class ReleaseNotesGenerator:
         except Exception:
             pass  # Fall back to simple tag listing
         
+        # Only probe for a repository once the real command has failed
+        if not self.is_git_repo():
+            raise Exception(f"'{self.repo_path}' is not a Git repository")
+        
         # Fallback: get tags without date info
         try:
             raw_tags = self.run_git_command(["tag", "-l"])
@@ -168,24 +247,23 @@ class ReleaseNotesGenerator:
         Returns:
             List of GitCommit objects
         """
-        # Format: git log --oneline --pretty=format:"%H|%an|%ad|%s" START_TAG..END_TAG
+        # Format: git log -z --pretty=format:"%h|%an|%ad|%s" START_TAG..END_TAG
+        # -z separates commits with NUL, which cannot occur inside a field
         cmd = [
             "log",
-            "--oneline",
-            "--pretty=format:%H|%an|%ad|%s",
+            "-z",
+            "--pretty=format:%h|%an|%ad|%s",
             f"{start_tag}..{end_tag}"
         ]
         
-        raw_commits = self.run_git_command(cmd)
-        
+        # Stream the log so commits are parsed while git is still walking history
         commits = []
-        if raw_commits:
-            for line in raw_commits.split('\n'):
-                if line.strip():
-                    parts = line.split('|', 3)  # Split into max 4 parts
-                    if len(parts) >= 4:
-                        commit_hash, author, date, subject = parts
-                        commits.append(GitCommit(commit_hash[:8], subject, author, date))
+        for record in self._iter_git_records(cmd, b'\x00'):
+            # Partition rather than split: only the subject may contain '|'
+            commit_hash, _, rest = record.partition('|')
+            author, _, rest = rest.partition('|')
+            date, _, subject = rest.partition('|')
+            commits.append(GitCommit(commit_hash, subject, author, date))
         
         return commits
     
@@ -197,27 +275,48 @@ class ReleaseNotesGenerator:
             commits: List of GitCommit objects
             
         Returns:
-            Dictionary mapping commit type to list of commits
+            Dictionary mapping commit type to list of commits. Only types that
+            occur are present, in the order their first commit appears;
+            generate_markdown orders sections by COMMIT_TYPES itself.
+        """
+        categorized = defaultdict(list)
+        valid_types = self._VALID_TYPES
+        
+        for commit in commits:
+            commit_type = commit.type
+            # Put unrecognized types in 'other'
+            categorized[commit_type if commit_type in valid_types else 'other'].append(commit)
+        
+        return dict(categorized)
+    
+    def _summarize(self, commits: List[GitCommit]) -> Tuple[Dict[str, List[GitCommit]], set]:
         """
-        categorized = {}
+        Categorize commits and collect their authors in a single pass.
         
-        for commit_type_key in self.COMMIT_TYPES.keys():
-            categorized[commit_type_key] = []
+        Same categories as categorize_commits; generate_markdown needs both
+        and would otherwise walk the commits twice.
+        
+        Args:
+            commits: List of GitCommit objects
+            
+        Returns:
+            Tuple of (dictionary mapping commit type to list of commits, set of authors)
+        """
+        # Only categories that actually receive commits are created
+        categorized = defaultdict(list)
+        authors = set()
+        valid_types = self._VALID_TYPES
         
-        # Add commits to appropriate categories
         for commit in commits:
             commit_type = commit.type
-            if commit_type in categorized:
-                categorized[commit_type].append(commit)
-            else:
-                # Put unrecognized types in 'other'
-                categorized['other'].append(commit)
+            # Put unrecognized types in 'other'
+            categorized[commit_type if commit_type in valid_types else 'other'].append(commit)
+            authors.add(commit.author)
         
-        # Remove empty categories
-        return {k: v for k, v in categorized.items() if v}
+        return dict(categorized), authors
     
     def generate_markdown(self, start_tag: str, end_tag: str, commits: List[GitCommit], 
-                         version_title: str = None) -> str:
+                         version_title: str = None, include_all_commits: bool = None) -> str:
         """
         Generate Markdown-formatted release notes.
         
@@ -226,49 +325,60 @@ class ReleaseNotesGenerator:
             end_tag: Ending tag
             commits: List of commits to include
             version_title: Custom title for the release
+            include_all_commits: Append an "All Commits" section listing every
+                commit again (if None, uses the generator's setting)
             
         Returns:
             Markdown-formatted string
         """
         if not version_title:
             version_title = f"Release {end_tag}"
+        if include_all_commits is None:
+            include_all_commits = self.include_all_commits
         
         # Get current date for the release notes
         current_date = datetime.now().strftime("%Y-%m-%d")
         
-        markdown = f"# {version_title}\n\n"
-        markdown += f"**Release Date:** {current_date}\n\n"
-        markdown += f"**Tags:** `{start_tag}` ... `{end_tag}`\n\n"
+        # Collect pieces and join once; repeated str += copies the whole output
+        out = []
+        emit = out.append
+        emit(f"# {version_title}\n\n")
+        emit(f"**Release Date:** {current_date}\n\n")
+        emit(f"**Tags:** `{start_tag}` ... `{end_tag}`\n\n")
         
         if not commits:
-            markdown += "No significant changes.\n\n"
-            return markdown
+            emit("No significant changes.\n\n")
+            return ''.join(out)
         
-        categorized = self.categorize_commits(commits)
+        categorized, authors = self._summarize(commits)
         
         # Add summary statistics
         total_commits = len(commits)
-        total_authors = len(set(c.author for c in commits))
+        total_authors = len(authors)
         
-        markdown += f"**Summary:** {total_commits} commits by {total_authors} authors\n\n"
+        emit(f"**Summary:** {total_commits} commits by {total_authors} authors\n\n")
         
-        # Add categorized commits
-        for commit_type, commit_list in categorized.items():
-            display_name = self.COMMIT_TYPES.get(commit_type, commit_type.title())
-            markdown += f"## {display_name}\n\n"
+        # Add categorized commits, in COMMIT_TYPES order
+        commit_url = f"{self.repo_url}/commit/"
+        for commit_type, display_name in self.COMMIT_TYPES.items():
+            commit_list = categorized.get(commit_type)
+            if not commit_list:
+                continue
+            emit(f"## {display_name}\n\n")
             
             for commit in commit_list:
                 scope_part = f" **({commit.scope})**" if commit.scope else ""
-                markdown += f"- {commit.description}{scope_part} ([`{commit.hash}`](https://github.com/unknown/unknown/commit/{commit.hash}))\n"
+                emit(f"- {commit.description}{scope_part} ([`{commit.hash}`]({commit_url}{commit.hash}))\n")
             
-            markdown += "\n"
+            emit("\n")
         
-        # Add all commits section (optional, can be disabled)
-        markdown += "## All Commits\n\n"
-        for commit in commits:
-            markdown += f"- [`{commit.subject}`]({commit.hash}) - {commit.author}\n"
+        # Add all commits section (optional, duplicates the categorized list)
+        if include_all_commits:
+            emit("## All Commits\n\n")
+            for commit in commits:
+                emit(f"- [`{commit.subject}`]({commit.hash}) - {commit.author}\n")
         
-        return markdown
+        return ''.join(out)
     
     def generate_release_notes(self, start_tag: str = None, end_tag: str = None, 
                               output_file: str = "RELEASE_NOTES.md", 
@@ -285,10 +395,6 @@ class ReleaseNotesGenerator:
         Returns:
             Generated markdown content
         """
-        print("Checking if this is a Git repository...")
-        if not self.is_git_repo():
-            raise Exception(f"'{self.repo_path}' is not a Git repository")
-        
         print("Getting available tags...")
         all_tags = self.get_latest_tags()
         
@@ -309,25 +415,12 @@ class ReleaseNotesGenerator:
                     break
         
         # Ensure we have the right order: older tag first, newer tag second
-        # Check which tag is older by looking at commit history
-        try:
-            # Check if start_tag is actually newer than end_tag
-            # If so, swap them
-            result = self.run_git_command(["merge-base", start_tag, end_tag], allow_failure=True)
-            if result:
-                # Determine chronological order by checking which is ancestor of the other
-                # If start_tag is an ancestor of end_tag, then the order is correct
-                # If end_tag is an ancestor of start_tag, then we need to swap
-                try:
-                    self.run_git_command(["merge-base", "--is-ancestor", start_tag, end_tag])
-                    # Order is correct: start_tag is older than end_tag
-                except subprocess.CalledProcessError:
-                    # start_tag is NOT an ancestor of end_tag, so swap them
-                    start_tag, end_tag = end_tag, start_tag
-        except:
-            # If merge-base fails, just swap them assuming the most recent tag is the end
-            # This is a fallback - in most cases the original order should be fine
-            pass
+        # If end_tag has no commits that start_tag lacks, the tags were given
+        # newest first, so swap them
+        count = self.run_git_command(["rev-list", "--count", f"{start_tag}..{end_tag}"],
+                                     allow_failure=True)
+        if count == "0":
+            start_tag, end_tag = end_tag, start_tag
         
         print(f"Generating release notes from {start_tag} to {end_tag}...")
         
@@ -364,7 +457,9 @@ Examples:
   %(prog)s -s v1.0.0 -e v1.1.0       # Generate notes between specific tags
   %(prog)s -o changelog.md           # Save to custom filename
   %(prog)s -r /path/to/repo          # Use different repository
+  %(prog)s -u https://github.com/owner/repo  # Link commits to this repository
   %(prog)s --title "My Custom Release"  # Custom release title
+  %(prog)s --all-commits             # Also list every commit at the end
         """
     )
     
@@ -378,8 +473,13 @@ Examples:
     parser.add_argument('-r', '--repo-path', 
                        default='.',
                        help='Path to Git repository (default: current directory)')
+    parser.add_argument('-u', '--repo-url',
+                       default='https://github.com/unknown/unknown',
+                       help='Web URL of the repository, used for commit links')
     parser.add_argument('--title',
                        help='Custom title for the release')
+    parser.add_argument('--all-commits', action='store_true',
+                       help='Append a section listing every commit')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose output')
     
@@ -392,7 +492,8 @@ Examples:
         print(f"End tag: {args.end_tag or 'auto'}")
     
     try:
-        generator = ReleaseNotesGenerator(args.repo_path)
+        generator = ReleaseNotesGenerator(args.repo_path, include_all_commits=args.all_commits,
+                                          repo_url=args.repo_url)
         content = generator.generate_release_notes(
             start_tag=args.start_tag,
             end_tag=args.end_tag,
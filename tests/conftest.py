@@ -0,0 +1,68 @@
+import shutil
+import subprocess
+
+import pytest
+
+
+# (author, message) for each commit after v1.0.0, oldest first
+GIT_REPO_COMMITS = [
+    ("Alice", "feat(auth): add login"),
+    ("Bob", "fix(api): resolve issue"),
+    ("Alice", "chore: update deps"),
+    # Only a body line looks like a conventional prefix
+    ("Bob", "Update README\n\nfix: typo in the install section"),
+    # %s joins a wrapped first paragraph into a single subject line
+    ("Alice", "feat(very long\nscope): wrapped prefix"),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_subprocess(request, monkeypatch):
+    """Fail any test that would spawn a real process instead of mocking git."""
+    if request.node.get_closest_marker("git"):
+        return
+
+    def blocked_popen(args, *popen_args, **popen_kwargs):
+        raise RuntimeError(f"Unmocked subprocess call: {args!r}")
+
+    # subprocess.run and friends go through Popen, so this covers them too
+    monkeypatch.setattr(subprocess, "Popen", blocked_popen)
+
+
+@pytest.fixture(scope="session")
+def git_repo(tmp_path_factory):
+    """
+    Real repository tagged v1.0.0 and v1.1.0, with GIT_REPO_COMMITS between them.
+
+    The whole history is written by a single `git fast-import` process rather
+    than one `git commit`/`git tag` per object, and is shared by every test
+    marked `git`.
+    """
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    repo = tmp_path_factory.mktemp("repo")
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+
+    stream = []
+    timestamp = 1672567200
+
+    def add(author, message):
+        nonlocal timestamp
+        timestamp += 3600
+        ident = f"{author} <{author.lower()}@example.com> {timestamp} +0000"
+        message = message.encode("utf-8")
+        stream.append(f"commit refs/heads/main\nauthor {ident}\ncommitter {ident}\n".encode("utf-8"))
+        stream.append(b"data %d\n%s\n" % (len(message), message))
+
+    def tag(name):
+        stream.append(f"reset refs/tags/{name}\nfrom refs/heads/main\n\n".encode("utf-8"))
+
+    add("Alice", "Initial commit")
+    tag("v1.0.0")
+    for author, message in GIT_REPO_COMMITS:
+        add(author, message)
+    tag("v1.1.0")
+
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=repo, input=b"".join(stream), check=True)
+    return str(repo)
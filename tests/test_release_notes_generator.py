@@ -0,0 +1,411 @@
+import io
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock, mock_open
+
+import pytest
+
+from release_notes_generator import GitCommit, ReleaseNotesGenerator
+
+
+# (subject, type, scope, description)
+PARSE_CASES = [
+    ("feat(auth): add login functionality", "feat", "auth", "add login functionality"),
+    ("fix: resolve issue with authentication", "fix", "", "resolve issue with authentication"),
+    ("Update README file", "other", "", "Update README file"),
+    ("refactor(api): improve error handling and logging", "refactor", "api",
+     "improve error handling and logging"),
+    # Multiple colons: only the first one ends the prefix
+    ("feat(scope): fix: important issue", "feat", "scope", "fix: important issue"),
+    # Special characters in scope
+    ("fix(api-v2): handle special chars", "fix", "api-v2", "handle special chars"),
+    # Empty scope is not a valid scope
+    ("chore(): ", "other", "", "chore(): "),
+    ("Just a plain commit message", "other", "", "Just a plain commit message"),
+    # Colon inside the scope belongs to the scope
+    ("feat(db:pg): add index", "feat", "db:pg", "add index"),
+    # Non-word characters in the type are not a conventional prefix
+    ("fix bug: crash on start", "other", "", "fix bug: crash on start"),
+    # Unclosed scope is not a conventional prefix
+    ("feat(auth: add login", "other", "", "feat(auth: add login"),
+    # Leading colon has no type
+    (": empty type", "other", "", ": empty type"),
+]
+
+
+@pytest.mark.parametrize("subject,commit_type,scope,description", PARSE_CASES)
+def test_parse_commit_message(subject, commit_type, scope, description):
+    """Test parsing of commit subjects into type, scope and description."""
+    commit = GitCommit("abc123", subject, "Author", "2023-01-01")
+
+    assert (commit.type, commit.scope, commit.description) == (commit_type, scope, description)
+
+
+def test_init_sets_properties_correctly():
+    """Test that GitCommit initialization sets all properties correctly."""
+    commit = GitCommit("abc12345", "Initial commit", "Author Name", "2023-01-01")
+
+    assert commit.hash == "abc12345"
+    assert commit.subject == "Initial commit"
+    assert commit.author == "Author Name"
+    assert commit.date == "2023-01-01"
+
+
+# (subjects, expected category keys in order)
+CATEGORIZE_CASES = [
+    (["feat: add new feature", "fix: resolve bug", "chore: update config"], ["feat", "fix", "chore"]),
+    # Unrecognized types go to 'other'
+    (["unknown: some commit"], ["other"]),
+    ([], []),
+    # Types are case insensitive
+    (["Feat: new feature", "FIX: bug fix", "REFACTOR: code cleanup"], ["feat", "fix", "refactor"]),
+    # Synonyms keep their own key; COMMIT_TYPES maps them to the same section
+    (["feature: new feature", "bugfix: critical bug fix", "docs: update docs", "test: add tests"],
+     ["feature", "bugfix", "docs", "test"]),
+    # Keys follow first appearance, not COMMIT_TYPES order
+    (["chore: update config", "feat: add new feature", "chore: bump version"], ["chore", "feat"]),
+]
+
+# Canned `git for-each-ref` output: tag|creatordate:unix, in no particular order
+FOR_EACH_REF_OUTPUT = (
+    "v1.2.0|1677664800\n"
+    "v1.0.0|1672567200\n"
+    "v1.1.0|1675245600"
+)
+
+# Canned `git tag -l` output, used when for-each-ref fails
+TAG_LIST_OUTPUT = "v1.1.0\nv1.0.0\nv0.9.0"
+
+# (for-each-ref result or exception, expected tags)
+GET_LATEST_TAGS_CASES = [
+    # Sorted from newest to oldest
+    (FOR_EACH_REF_OUTPUT, ["v1.2.0", "v1.1.0", "v1.0.0"]),
+    # Tags without a date sort last
+    ("v2.0.0|\nv1.0.0|1672567200", ["v1.0.0", "v2.0.0"]),
+    # No tags at all
+    ("", []),
+    # for-each-ref fails: fall back to simple tag listing
+    (None, ["v1.1.0", "v1.0.0", "v0.9.0"]),
+    (Exception("Date command failed"), ["v1.1.0", "v1.0.0", "v0.9.0"]),
+]
+
+# (commit subjects, text the rendered markdown must contain)
+MD_BASIC_SUBJECTS = ("feat: add login", "fix: resolve issue")
+MD_SPECIAL_SUBJECTS = ("feat: add support for C++", "fix: handle \"quotes\" and 'apostrophes'")
+MD_CASES = [
+    (MD_BASIC_SUBJECTS, "# Release v1.1.0"),
+    (MD_BASIC_SUBJECTS, "**Tags:** `v1.0.0` ... `v1.1.0`"),
+    (MD_BASIC_SUBJECTS, "## Features"),
+    (MD_BASIC_SUBJECTS, "## Bug Fixes"),
+    (MD_BASIC_SUBJECTS, "add login"),
+    (MD_BASIC_SUBJECTS, "resolve issue"),
+    ((), "# Release v1.1.0"),
+    ((), "No significant changes."),
+    (("feat(auth): add login",), "add login **(auth)**"),
+    (MD_SPECIAL_SUBJECTS, "C++"),
+    (MD_SPECIAL_SUBJECTS, "\"quotes\""),
+    (MD_SPECIAL_SUBJECTS, "'apostrophes'"),
+]
+
+# (output of every git command, expected error message)
+GENERATE_RELEASE_NOTES_ERROR_CASES = [
+    # for-each-ref and the rev-parse repository probe both fail
+    (None, "not a Git repository"),
+    ("", "No tags found"),
+    ("v1.0.0|1672567200", "Need at least 2 tags"),
+]
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Shared generator; tests patch the class, never the instance."""
+    return ReleaseNotesGenerator()
+
+
+@pytest.fixture(scope="module")
+def sample_commits():
+    """Shared commits, one per section, oldest first; copy before mutating."""
+    return (
+        GitCommit("abc123", "feat(auth): add login", "Author1", "2023-01-01"),
+        GitCommit("def456", "fix(api): resolve issue", "Author2", "2023-01-02"),
+        GitCommit("ghi789", "chore: update deps", "Author1", "2023-01-03"),
+    )
+
+
+@pytest.fixture
+def gen_mocks(monkeypatch):
+    """Replace the git-facing steps of generate_release_notes with mocks."""
+    mocks = SimpleNamespace(
+        run_git=Mock(return_value=None),
+        get_tags=Mock(),
+        get_commits=Mock(return_value=[]),
+        gen_md=Mock(return_value="# Release Notes"),
+    )
+    monkeypatch.setattr(ReleaseNotesGenerator, "run_git_command", mocks.run_git)
+    monkeypatch.setattr(ReleaseNotesGenerator, "get_latest_tags", mocks.get_tags)
+    monkeypatch.setattr(ReleaseNotesGenerator, "get_commits_between_tags", mocks.get_commits)
+    monkeypatch.setattr(ReleaseNotesGenerator, "generate_markdown", mocks.gen_md)
+    return mocks
+
+
+@patch('subprocess.run', new_callable=lambda: MagicMock(spec=subprocess.run))
+def test_run_git_command_success(mock_subprocess, generator):
+    """Test successful execution of git command."""
+    mock_subprocess.return_value = SimpleNamespace(stdout="output", stderr="", returncode=0)
+    
+    result = generator.run_git_command(["status"])
+    
+    assert result == "output"
+    mock_subprocess.assert_called_once()
+
+
+@patch('subprocess.run', new_callable=lambda: MagicMock(spec=subprocess.run))
+def test_run_git_command_failure_no_allow_failure(mock_subprocess, generator):
+    """Test git command failure without allowing failure."""
+    mock_subprocess.side_effect = Exception("Command failed")
+    
+    with pytest.raises(Exception):
+        generator.run_git_command(["invalid-command"])
+
+
+@patch('subprocess.run', new_callable=lambda: MagicMock(spec=subprocess.run))
+def test_run_git_command_failure_with_allow_failure(mock_subprocess, generator):
+    """Test git command failure with allow_failure enabled."""
+    mock_subprocess.side_effect = subprocess.CalledProcessError(returncode=1, cmd=['git', 'invalid-command'])
+    
+    result = generator.run_git_command(["invalid-command"], allow_failure=True)
+    
+    assert result is None
+
+
+@patch('subprocess.Popen')
+def test_get_commits_between_tags(mock_popen, generator):
+    """Test that streamed git log output is parsed into commits."""
+    mock_process = mock_popen.return_value.__enter__.return_value
+    mock_process.stdout = io.BytesIO(
+        b"abc1234|Author1|Mon Jan 2 10:00:00 2023 +0000|feat(auth): add login\x00"
+        b"def4567|Author2|Tue Jan 3 10:00:00 2023 +0000|fix: handle a|b"
+    )
+    mock_process.returncode = 0
+
+    commits = generator.get_commits_between_tags("v1.0.0", "v1.1.0")
+
+    assert [c.hash for c in commits] == ["abc1234", "def4567"]
+    assert commits[0].author == "Author1"
+    assert commits[0].scope == "auth"
+    assert commits[1].description == "handle a|b"
+
+
+@patch('subprocess.Popen')
+def test_get_commits_between_tags_invalid_utf8(mock_popen, generator):
+    """Test that undecodable bytes in git output do not abort parsing."""
+    mock_process = mock_popen.return_value.__enter__.return_value
+    mock_process.stdout = io.BytesIO(b"abc1234|Ren\xe9|Mon Jan 2 10:00:00 2023 +0000|fix: typo")
+    mock_process.returncode = 0
+
+    commits = generator.get_commits_between_tags("v1.0.0", "v1.1.0")
+
+    assert commits[0].author == "Ren\ufffd"
+    assert commits[0].type == "fix"
+
+
+@patch('tempfile.TemporaryFile', return_value=io.BytesIO(b"fatal: bad revision"))
+@patch('subprocess.Popen')
+def test_get_commits_between_tags_failure(mock_popen, mock_temporary_file, generator):
+    """Test that a failing git log raises CalledProcessError with git's stderr."""
+    mock_process = mock_popen.return_value.__enter__.return_value
+    mock_process.stdout = io.BytesIO(b"")
+    mock_process.returncode = 128
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        generator.get_commits_between_tags("v1.0.0", "missing")
+    
+    assert exc_info.value.stderr == "fatal: bad revision"
+    # stderr is never a pipe that git could fill while stdout is being read
+    assert mock_popen.call_args.kwargs["stderr"] is mock_temporary_file.return_value
+
+
+@patch.object(ReleaseNotesGenerator, 'run_git_command')
+def test_is_git_repo_true(mock_run_git_command, generator):
+    """Test is_git_repo returns True when valid git repo."""
+    mock_run_git_command.return_value = ".git"
+    
+    result = generator.is_git_repo()
+    
+    assert result
+
+
+@patch.object(ReleaseNotesGenerator, 'run_git_command')
+def test_is_git_repo_false(mock_run_git_command, generator):
+    """Test is_git_repo returns False when not a git repo."""
+    mock_run_git_command.return_value = None
+    
+    result = generator.is_git_repo()
+    
+    assert not result
+
+
+@pytest.mark.parametrize("subjects,expected_keys", CATEGORIZE_CASES)
+def test_categorize_commits(generator, subjects, expected_keys):
+    """Test commit categorization by type."""
+    commits = [GitCommit("abc123", subject, "Author", "2023-01-01") for subject in subjects]
+    
+    categorized = generator.categorize_commits(commits)
+    
+    assert list(categorized) == expected_keys
+    assert sum(len(commit_list) for commit_list in categorized.values()) == len(commits)
+
+
+@pytest.mark.parametrize("subjects,expected", MD_CASES)
+def test_generate_markdown_contains(generator, subjects, expected):
+    """Test that the rendered markdown contains the expected text."""
+    commits = [GitCommit("abc123", subject, "Author", "2023-01-01") for subject in subjects]
+    
+    markdown = generator.generate_markdown("v1.0.0", "v1.1.0", commits)
+    
+    assert expected in markdown
+
+
+def test_generate_markdown_custom_title(generator, sample_commits):
+    """Test markdown generation with custom title."""
+    markdown = generator.generate_markdown(
+        "v1.0.0", "v1.1.0", sample_commits, version_title="My Custom Release"
+    )
+    
+    assert "# My Custom Release" in markdown
+
+
+def test_generate_markdown_repo_url(sample_commits):
+    """Test that commit links point at the configured repository."""
+    generator = ReleaseNotesGenerator(repo_url="https://github.com/owner/repo/")
+    markdown = generator.generate_markdown("v1.0.0", "v1.1.0", sample_commits)
+
+    assert "([`abc123`](https://github.com/owner/repo/commit/abc123))" in markdown
+
+
+def test_generate_markdown_section_order(generator, sample_commits):
+    """Test that sections follow COMMIT_TYPES order, not commit order."""
+    commits = list(reversed(sample_commits))
+
+    markdown = generator.generate_markdown("v1.0.0", "v1.1.0", commits)
+
+    features = markdown.index("## Features")
+    bug_fixes = markdown.index("## Bug Fixes")
+    chores = markdown.index("## Chores")
+    assert features < bug_fixes
+    assert bug_fixes < chores
+
+
+def test_generate_markdown_all_commits_section(generator, sample_commits):
+    """Test that the All Commits section is only emitted on request."""
+    commits = sample_commits[:1]
+
+    markdown = generator.generate_markdown("v1.0.0", "v1.1.0", commits)
+    assert "## All Commits" not in markdown
+
+    markdown = generator.generate_markdown(
+        "v1.0.0", "v1.1.0", commits, include_all_commits=True
+    )
+    assert "## All Commits" in markdown
+    assert "- [`feat(auth): add login`](abc123) - Author1" in markdown
+
+    all_commits_generator = ReleaseNotesGenerator(include_all_commits=True)
+    markdown = all_commits_generator.generate_markdown("v1.0.0", "v1.1.0", commits)
+    assert "## All Commits" in markdown
+
+
+def test_generate_release_notes_defaults(gen_mocks, generator):
+    """Test generate_release_notes with default parameters."""
+    gen_mocks.get_tags.return_value = ["v1.1.0", "v1.0.0"]
+    
+    with patch('release_notes_generator.open', mock_open(), create=True) as mock_file:
+        result = generator.generate_release_notes(output_file="RELEASE_NOTES.md")
+    
+    assert result == "# Release Notes"
+    gen_mocks.get_tags.assert_called_once()
+    gen_mocks.get_commits.assert_called_once_with("v1.0.0", "v1.1.0")
+    mock_file.assert_called_once_with("RELEASE_NOTES.md", 'w', encoding='utf-8')
+    mock_file().write.assert_called_once_with("# Release Notes")
+
+
+def test_generate_release_notes_custom_tags(gen_mocks, generator):
+    """Test generate_release_notes with custom tags."""
+    gen_mocks.get_tags.return_value = ["v2.0.0", "v1.5.0", "v1.0.0"]
+    
+    with patch('release_notes_generator.open', mock_open(), create=True):
+        result = generator.generate_release_notes(
+            start_tag="v1.0.0", 
+            end_tag="v2.0.0", 
+            output_file="RELEASE_NOTES.md"
+        )
+    
+    assert result == "# Release Notes"
+    gen_mocks.get_commits.assert_called_once_with("v1.0.0", "v2.0.0")
+
+
+def test_generate_release_notes_swaps_reversed_tags(gen_mocks, generator):
+    """Test that tags given newest first are swapped."""
+    gen_mocks.get_tags.return_value = ["v2.0.0", "v1.0.0"]
+    gen_mocks.run_git.return_value = "0"  # no commits in v2.0.0..v1.0.0
+    
+    with patch('release_notes_generator.open', mock_open(), create=True):
+        generator.generate_release_notes(start_tag="v2.0.0", end_tag="v1.0.0")
+    
+    gen_mocks.run_git.assert_called_once_with(
+        ["rev-list", "--count", "v2.0.0..v1.0.0"], allow_failure=True
+    )
+    gen_mocks.get_commits.assert_called_once_with("v1.0.0", "v2.0.0")
+
+
+@pytest.mark.parametrize("git_output,message", GENERATE_RELEASE_NOTES_ERROR_CASES)
+def test_generate_release_notes_errors(monkeypatch, generator, git_output, message):
+    """Test generate_release_notes raises without a repository or two tags."""
+    # Only git itself is mocked; get_latest_tags and is_git_repo run for real
+    monkeypatch.setattr(ReleaseNotesGenerator, "run_git_command", Mock(return_value=git_output))
+    
+    with pytest.raises(Exception, match=message):
+        generator.generate_release_notes()
+
+
+@pytest.mark.parametrize("for_each_ref_output,expected_tags", GET_LATEST_TAGS_CASES)
+@patch.object(ReleaseNotesGenerator, 'run_git_command')
+def test_get_latest_tags(mock_run_git_command, generator, for_each_ref_output, expected_tags):
+    """Test tag ordering and the fallback to plain tag listing."""
+    def side_effect_func(command, allow_failure=False):
+        if command == ["rev-parse", "--git-dir"]:
+            return ".git"  # Simulate git repo exists
+        elif "for-each-ref" in command:
+            if isinstance(for_each_ref_output, Exception):
+                raise for_each_ref_output
+            return for_each_ref_output
+        elif command == ["tag", "-l"]:
+            return TAG_LIST_OUTPUT
+        return "default"
+    
+    mock_run_git_command.side_effect = side_effect_func
+    
+    assert generator.get_latest_tags() == expected_tags
+
+
+def test_full_workflow_simulation(generator, sample_commits):
+    """Test that parsing, categorization and rendering compose end to end."""
+    markdown = generator.generate_markdown("v1.0.0", "v1.1.0", sample_commits)
+    
+    # One section per category, and every commit rendered exactly once
+    assert markdown.count("## ") == 3
+    assert all(markdown.count(f"[`{c.hash}`]") == 1 for c in sample_commits)
+
+
+@pytest.mark.git
+def test_generate_release_notes_real_repo(git_repo, tmp_path):
+    """Test the whole pipeline against a real repository."""
+    generator = ReleaseNotesGenerator(repo_path=git_repo)
+    
+    markdown = generator.generate_release_notes(output_file=str(tmp_path / "RELEASE_NOTES.md"))
+    
+    assert "**Tags:** `v1.0.0` ... `v1.1.0`" in markdown
+    assert "**Summary:** 5 commits by 2 authors" in markdown
+    for title in ("## Features", "## Bug Fixes", "## Chores", "## Other Changes"):
+        assert title in markdown
+    assert "wrapped prefix **(very long scope)**" in markdown
+    assert "Initial commit" not in markdown